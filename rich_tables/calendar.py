@@ -11,7 +11,7 @@ from rich.columns import Columns
 from typing_extensions import Literal, NotRequired, TypedDict
 
 from .fields import get_val
-from .utils import border_panel, new_table, sortgroup_by, wrap
+from .utils import border_panel, get_now, new_table, sortgroup_by, wrap
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -45,11 +45,7 @@ class Period:
 
     @classmethod
     def make(cls, **kwargs: Any) -> Period:
-        kwargs["fmt"] = (
-            "dim strike"
-            if kwargs["end"] < datetime.now(tz=kwargs["end"].tzinfo)
-            else ""
-        )
+        kwargs["fmt"] = "dim strike" if kwargs["end"].timestamp() < get_now() else ""
         kwargs["desc"] = (kwargs["desc"] or "").strip()
         return cls(**kwargs)
 
@@ -116,28 +112,16 @@ class Event:
         return dt
 
     def get_periods(self) -> list[Period]:
-        diff = self.end - self.start
-        h_after_midnight = (24 * diff.days + (diff.seconds // 3600)) - (
-            24 - self.start.hour
-        )
-
-        end = (self.start + timedelta(days=1)).replace(hour=0, minute=0, second=0)
-
-        def eod(day_offset: int) -> datetime:
-            return (self.start + timedelta(days=day_offset)).replace(
-                hour=23, minute=59, second=59
-            )
-
-        def midnight(day_offset: int) -> datetime:
-            return (self.start + timedelta(days=day_offset)).replace(
-                hour=0, minute=0, second=0
-            )
+        hours = (self.end - self.start) // timedelta(hours=1)
+        h_after_midnight = hours - (24 - self.start.hour)
 
         days_count = h_after_midnight // 24 + 1
+        midnight = self.start.replace(hour=0, minute=0, second=0)
+        midnights = [midnight + timedelta(days=d) for d in range(1, days_count + 1)]
         periods = []
         for start, end in zip(
-            [self.start, *map(midnight, range(1, days_count + 1))],
-            [*map(eod, range(days_count)), self.end],
+            [self.start, *midnights],
+            [*(m - timedelta(seconds=1) for m in midnights), self.end],
         ):
             periods.append(
                 Period.make(
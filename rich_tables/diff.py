@@ -9,13 +9,27 @@ with specialized formatting for each type.
 from __future__ import annotations
 
 import re
-from difflib import SequenceMatcher
-from functools import partial
-from itertools import starmap, zip_longest
-from typing import Any, Literal
+from functools import lru_cache, partial
+from itertools import accumulate, zip_longest
+from typing import TYPE_CHECKING, Any, Literal
 
 from multimethod import multimethod
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
+
+try:
+    from rapidfuzz.distance import Levenshtein
+
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 from .utils import (
     BOLD_GREEN,
     BOLD_RED,
@@ -27,6 +41,12 @@ from .utils import (
 )
 
 MIN_EQUAL_LENGTH = 5
+# inputs at least this long are diffed word by word
+WORD_DIFF_MIN_LENGTH = 2000
+
+Opcode = tuple[str, int, int, int, int]
+
+tokenize = re.compile(r"\S+|\s+").findall
 
 underscore_space = partial(re.compile(r"(^ +)|( +$)").sub, r"[u]\g<0>[/]")
 mark_newline = partial(
@@ -62,14 +82,64 @@ def fmtdiff(change: str, before: str, after: str) -> str:
     return wrap(before, "dim")
 
 
+def get_opcodes(before: str, after: str) -> list[Opcode]:
+    """Return the operations that turn `before` into `after`.
+
+    Long inputs are matched word by word rather than character by character,
+    which is much faster and aligns changes on word boundaries. Token positions
+    are then translated back to character offsets, so both cases return the
+    same kind of opcodes.
+    """
+    if max(len(before), len(after)) < WORD_DIFF_MIN_LENGTH:
+        ops: list[Opcode] = SequenceMatcher(
+            None, before, after, autojunk=False
+        ).get_opcodes()
+        return ops
+
+    before_tokens, after_tokens = tokenize(before), tokenize(after)
+    a_pos = [0, *accumulate(map(len, before_tokens))]
+    b_pos = [0, *accumulate(map(len, after_tokens))]
+    return [
+        (op, a_pos[a1], a_pos[a2], b_pos[b1], b_pos[b2])
+        for op, a1, a2, b1, b2 in get_token_opcodes(before_tokens, after_tokens)
+    ]
+
+
+def get_token_opcodes(before: list[str], after: list[str]) -> Iterable[Opcode]:
+    """Return the operations that turn the `before` tokens into `after` tokens.
+
+    Use the native Levenshtein implementation from `rapidfuzz` if it is available:
+    on long texts made of a limited vocabulary `SequenceMatcher` gets close to
+    quadratic.
+    """
+    if not HAS_RAPIDFUZZ:
+        ops: list[Opcode] = SequenceMatcher(
+            None, before, after, autojunk=False
+        ).get_opcodes()
+        return ops
+
+    return (
+        (o.tag, o.src_start, o.src_end, o.dest_start, o.dest_end)
+        for o in Levenshtein.opcodes(before, after)
+    )
+
+
+@lru_cache(maxsize=1024)
 def make_difftext(before: str, after: str) -> str:
     """Generate formatted text showing differences between two strings.
 
     Creates a unified, styled representation merging small equal sections
     into larger replace operations for improved readability.
     """
-    matcher = SequenceMatcher(lambda x: x in "", autojunk=False, a=before, b=after)
-    ops = matcher.get_opcodes()
+    # Trivial cases produce a single operation, skip matching for them
+    if before == after:
+        return wrap(before, "dim") if before else ""
+    if not before:
+        return format_new(after)
+    if not after:
+        return format_old(before)
+
+    ops = get_opcodes(before, after)
     # Identify small "equal" sections that should be merged with surrounding changes
     # This creates more cohesive diff chunks by avoiding tiny unchanged fragments
     to_remove_ids = [
@@ -129,7 +199,7 @@ def _(before: Any, after: Any) -> Any:
 
 @diff.register
 def _(before: HashableList[Any], after: HashableList[Any]) -> Any:
-    return list(starmap(diff, zip_longest(before, after)))
+    return [diff(a, b) for a, b in zip_longest(before, after)]
 
 
 @diff.register
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from collections import defaultdict
+from bisect import bisect_right
 from collections.abc import Iterable, MutableMapping
 from contextlib import suppress
 from datetime import datetime, timezone
@@ -42,7 +42,9 @@ if TYPE_CHECKING:
 
 
 MATCH_COUNT_HEADER = re.compile(r"duration|(?:_sum$|_?count$)")
-MAX_BPM_COLOR = (("green", 135), ("yellow", 165), ("red", 400))
+# upper (exclusive) bpm bounds of each color
+BPM_THRESHOLDS = (135, 165, 400)
+BPM_COLORS = ("green", "yellow", "red")
 
 
 def add_count_bars(
@@ -59,19 +61,18 @@ def add_count_bars(
     max_value = max(all_counts)
 
     bar_key = f"{count_key}_bar"
+    inverse = count_key.endswith("duration")
     for item in data:
         subcount = None
-        inverse = count_key.endswith("duration")
-        count = item[count_key]
+        count = item.pop(count_key)
         if subcount_key:
             subcount = float(item[subcount_key])
             count_val = f"{subcount}/{count}"
-        elif count_key.endswith("duration"):
+        elif inverse:
             count_val = duration2human(count)
         else:
             count_val = str(count)
 
-        item.pop(count_key, None)
         item[new_count_key] = count_val
         item[bar_key] = progress_bar(
             end=subcount, width=max_value, size=count, inverse=inverse
@@ -91,8 +92,7 @@ def add_count_bars(
     return data
 
 
-FIELDS_MAP: MutableMapping[str, Callable[..., RenderableType]] = defaultdict(
-    lambda: str,
+FIELDS_MAP: MutableMapping[str, Callable[..., RenderableType]] = dict(
     diff=lambda x: pretty_diff(*x),
     albumtypes=lambda x: " ".join(
         map(
@@ -126,14 +126,14 @@ FIELDS_MAP: MutableMapping[str, Callable[..., RenderableType]] = defaultdict(
         " ".join(islice(fmt_time(int(float(x))), 1)), BOLD_GREEN
     ),
     bpm=lambda x: (
-        wrap(str(x), next(c for c, m in MAX_BPM_COLOR if x < m))
+        wrap(str(x), BPM_COLORS[bisect_right(BPM_THRESHOLDS, x)])
         if isinstance(x, int)
         else x
     ),
     length=timestamp2timestr,
     tracktotal=lambda x: (
         (wrap("{}", "b cyan") + "/" + wrap("{}", "b cyan")).format(*x)
-        if isinstance(x, Iterable) and not isinstance(x, str)
+        if isinstance(x, (list, HashableList, tuple))
         else str(x)
     ),
     category=lambda x: "/".join(map(format_with_color, x.split("/"))),
@@ -276,7 +276,7 @@ def _get_val(value: float | str | RenderableType | None, field: str) -> Renderab
         return "None"
 
     if field.endswith(".py"):
-        return border_panel(syntax(value, "python"), title=field)
+        return border_panel(syntax(str(value), "python"), title=field)
 
     if isinstance(value, str):
         value = format_string(value)
@@ -284,9 +284,9 @@ def _get_val(value: float | str | RenderableType | None, field: str) -> Renderab
     if isinstance(value, ConsoleRenderable):
         return value
 
-    if field in FIELDS_MAP:
+    if fmt := FIELDS_MAP.get(field):
         with suppress(Exception):
-            return FIELDS_MAP[field](value)
+            return fmt(value)
 
     return str(value)
 
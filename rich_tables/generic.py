@@ -19,8 +19,8 @@ from collections import defaultdict
 from collections.abc import Iterable
 from contextlib import nullcontext, suppress
 from datetime import datetime, timezone
-from functools import cache, reduce, wraps
-from itertools import groupby
+from functools import cache, lru_cache, reduce, wraps
+from itertools import chain, groupby
 from operator import and_
 from typing import TYPE_CHECKING, Any, Callable, TypeVar, Union
 
@@ -136,7 +136,33 @@ def prepare_dict(item: HashableDict) -> HashableDict:
     return item
 
 
-@multidispatch
+class FastPathDispatch(multidispatch[R]):
+    """Multiple dispatch with a fast path for the most common argument types.
+
+    Some registered signatures are parametrised generics, which makes resolving
+    the implementation comparatively slow. Scalars make up most of the rendered
+    values, so their exact types are mapped straight to the implementation in
+    `fast_path`, and every other call falls back to regular dispatch.
+    """
+
+    fast_path: dict[type, Callable[..., R]]
+
+    def __init__(self, func: Callable[..., R]) -> None:
+        super().__init__(func)
+        self.fast_path = {}
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        if (
+            len(args) == 1
+            and not kwargs
+            and (func := self.fast_path.get(type(args[0])))
+        ):
+            return func(*args)
+
+        return super().__call__(*args, **kwargs)
+
+
+@FastPathDispatch
 @cache
 @debug
 def flexitable(data: Any) -> RenderableType:
@@ -157,6 +183,9 @@ def _num(data: Union[str, float]) -> RenderableType:
     return format_string(str(data))
 
 
+flexitable.fast_path.update(dict.fromkeys((str, float), _num))
+
+
 @flexitable.register
 @debug
 def _list(data: list[Any]) -> RenderableType:
@@ -194,6 +223,19 @@ def _header(data: Any, header: str) -> RenderableType:
         return flexitable(data)
 
 
+def min_width(renderable: RenderableType) -> int:
+    """Return the minimum width the renderable needs, caching it for strings."""
+    if isinstance(renderable, str):
+        return _min_text_width(renderable, console.width)
+
+    return console.measure(renderable).minimum
+
+
+@lru_cache(maxsize=4096)
+def _min_text_width(text: str, width: int) -> int:
+    return console.measure(text, options=console.options.update_width(width)).minimum
+
+
 @flexitable.register
 @debug
 def _json_dict_list(data: HashableDict[str, HashableList[HashableDict]]) -> Tree:
@@ -233,11 +275,8 @@ def _json_dict_list(data: HashableDict[str, HashableList[HashableDict]]) -> Tree
                         columns_by_header[NewTable.get_display_header(col)].append(col)
 
     for header, cols in columns_by_header.items():
-        col_ratio = max(
-            console.measure(_c).minimum + 1
-            for col in cols
-            for _c in [header, *col.cells]
-        )
+        cells = (c for col in cols for c in col.cells)
+        col_ratio = 1 + max(min_width(header), max(map(min_width, cells), default=0))
         for col in cols:
             col.ratio = col_ratio
 
@@ -322,8 +361,7 @@ def get_item_list_table(
     kwargs.setdefault("box", box.SIMPLE_HEAD)
     table = new_table(*keys, **kwargs)
 
-    for item in items:
-        table.add_dict_row(item, transform=flexitable)
+    table.add_dict_rows(items, transform=flexitable)
 
     for column in table.columns:
         column.header_style = predictably_random_color(str(column.header))
@@ -336,9 +374,7 @@ def _render_dict_list(data: HashableList[HashableDict]) -> NewTable:
     if count_key := next((k for k in data[0] if MATCH_COUNT_HEADER.search(k)), None):
         data = add_count_bars(data, count_key)
 
-    all_fields: dict[str, None] = {}
-    for item in data:
-        all_fields.update(dict.fromkeys(item))
+    all_fields = dict.fromkeys(chain.from_iterable(data))
 
     fields = all_fields
     # fields = dict.fromkeys(
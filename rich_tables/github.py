@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import time
 from collections import defaultdict
 from dataclasses import dataclass
 from itertools import islice
@@ -19,6 +18,7 @@ from .utils import (
     fmt_time,
     format_with_color,
     format_with_color_on_black,
+    get_now,
     list_table,
     md_panel,
     new_table,
@@ -57,7 +57,7 @@ def diff_dt(timestamp: str | float, acc: int = 2) -> str:
     except ValueError:
         return str(timestamp)
 
-    diff = datetime.timestamp() - time.time()
+    diff = datetime.timestamp() - get_now()
     fmted = " ".join(islice(fmt_time(int(diff)), acc))
 
     strtime = datetime.strftime("%F" if abs(diff) >= SECONDS_PER_DAY else "%T")
@@ -102,6 +102,14 @@ COLOR_BY_STATE = defaultdict(
     },
 )
 
+SYMBOL_BY_CHECK_STATUS = {
+    "SUCCESS": ":green_square:",
+    "FAILURE": ":red_square:",
+    "PENDING": ":yellow_square:",
+    "None": "",
+}
+SYMBOL_BY_ISSUE_STATE = {"OPEN": "[b green][/]", "CLOSED": "[b magenta][/]"}
+
 
 def fmt_state(state: str) -> str:
     return wrap(state, f"b {COLOR_BY_STATE[state]}")
@@ -116,12 +124,7 @@ def diff_panel(title: str, rows: list[list[str]]) -> Panel:
 
 
 PR_FIELDS_MAP: Mapping[str, Callable[..., RenderableType]] = {
-    "statusCheckRollup": lambda x: {
-        "SUCCESS": ":green_square:",
-        "FAILURE": ":red_square:",
-        "PENDING": ":yellow_square:",
-        "None": "",
-    }[x],
+    "statusCheckRollup": SYMBOL_BY_CHECK_STATUS.__getitem__,
     "state": lambda x: wrap(fmt_state(x), "b"),
     "reviewDecision": lambda x: wrap(fmt_state(x), "b"),
     "dates": lambda x: new_table(
@@ -421,7 +424,7 @@ class Issue:
 
     @property
     def status(self) -> str:
-        return {"OPEN": "[b green][/]", "CLOSED": "[b magenta][/]"}[self.state]
+        return SYMBOL_BY_ISSUE_STATE[self.state]
 
     @property
     def fmt(self) -> str:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import operator as op
 from collections import defaultdict
-from functools import lru_cache, partial
+from functools import partial
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from rich import box
@@ -65,18 +65,11 @@ def get_header(key: str) -> str:
     return DISPLAY_HEADER.get(key, key)
 
 
-@lru_cache(maxsize=128)
-def get_val(track: JSONDict, field: str) -> Any:
-    trackdict = dict(track)
-    return FIELDS_MAP[field](trackdict[field]) if trackdict.get(field) else ""
-
-
 def tracks_table(tracks: list[JSONDict], fields: list[str], color: str) -> NewTable:
     get_values = op.itemgetter(*fields)
     tracks_data = [dict(zip(fields, get_values(t))) for t in tracks]
     table = new_table(border_style=color, padding=(0, 0, 0, 1))
-    for item in tracks_data:
-        table.add_dict_row(item, transform=flexitable)
+    table.add_dict_rows(tracks_data, transform=flexitable)
 
     return table
 
@@ -136,8 +129,8 @@ def album_info(tracks: list[JSONDict]) -> JSONDict:
         album.update(album="Singles", albumartist=first["artist"])
     album.update(**album_stats(tracks))
     add_colors(album)
-    for field, _ in filter(op.truth, sorted(album.items())):
-        album[field] = get_val(tuple(album.items()), field)
+    for field, value in sorted(album.items()):
+        album[field] = FIELDS_MAP.get(field, str)(value) if value else ""
     album["album_title"] = album_title(album)
     return album
 
@@ -156,13 +149,17 @@ def album_panel(tracks: list[JSONDict]) -> Panel:
     album = album_info(tracks)
     url = album.pop("url", "")
 
-    track_fields = list(TRACK_FIELDS)
+    skip_fields = set()
     # ignore the artist field if there is only one found
     if len(tracks) > 1 and len({t.get("artist") for t in tracks}) == 1:
-        track_fields.remove("artist")
+        skip_fields.add("artist")
 
     # ignore empty fields
-    track_fields = [f for f in track_fields if any(t.get(f) for t in tracks)]
+    track_fields = [
+        f
+        for f in TRACK_FIELDS
+        if f not in skip_fields and any(t.get(f) for t in tracks)
+    ]
     tracks = sorted(tracks, key=op.itemgetter("track", "artist", "title"))
     tracklist = tracks_table(tracks, track_fields, album["album_color"])
 
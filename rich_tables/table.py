@@ -6,7 +6,7 @@ import json
 import sys
 import tempfile
 from contextlib import contextmanager
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -19,7 +19,7 @@ from .fields import get_val
 from .generic import flexitable
 from .github import pulls_table
 from .music import albums_table
-from .utils import console, new_table, wrap
+from .utils import console, freeze_now, new_table, wrap
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -34,12 +34,17 @@ JSONDict = dict[str, Any]
 install(console=console, show_locals=True, width=console.width)
 
 
-def lights_table(lights: list[JSONDict], **__: Any) -> Iterator[Table]:
+@lru_cache(maxsize=256)
+def xy_to_hex(x: float, y: float) -> str:
+    """Convert CIE xy coordinates reported by a Hue light to a hex color."""
     from rgbxy import Converter
 
+    return Converter().xy_to_hex(x, y)  # type: ignore[no-any-return]
+
+
+def lights_table(lights: list[JSONDict], **__: Any) -> Iterator[Table]:
     headers = lights[0].keys()
     table = new_table(*headers)
-    conv = Converter()
     for light in lights:
         xy = light.get("xy")
         style = ""
@@ -47,9 +52,9 @@ def lights_table(lights: list[JSONDict], **__: Any) -> Iterator[Table]:
             style = "dim"
             light["xy"] = ""
         elif xy:
-            color = conv.xy_to_hex(*xy)
+            color = xy_to_hex(*xy)
             light["xy"] = wrap("   a", f"#{color} on #{color}")
-        table.add_row(*(get_val(light, h) for h in headers), style=style)
+        table.add_row(*[get_val(light, h) for h in headers], style=style)
     yield table
 
 
@@ -153,7 +158,7 @@ def handle_save(save: bool) -> Iterator[None]:
 def main() -> None:
     args = get_args()
 
-    with handle_save(args.save):
+    with handle_save(args.save), freeze_now():
         if args.command == "diff":
             console.print(pretty_diff(args.before, args.after), highlight=False)
         else:
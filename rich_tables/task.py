@@ -112,8 +112,8 @@ class Task:
 
 def get_headers(task_headers: Iterable[str]) -> list[str]:
     """Return the list of headers that will be used in the table."""
-    ordered_keys = dict.fromkeys([*INITIAL_HEADERS, *sorted(task_headers)]).keys()
-    return [*[k for k in ordered_keys if k not in SKIP_HEADERS], "tree"]
+    ordered_keys = dict.fromkeys([*INITIAL_HEADERS, *sorted(task_headers)])
+    return [k for k in ordered_keys if k not in SKIP_HEADERS]
 
 
 fields_map: JSONDict = {
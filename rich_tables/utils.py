@@ -3,19 +3,23 @@ from __future__ import annotations
 import colorsys
 import random
 import re
-from collections import UserDict, UserList
-from collections.abc import Hashable, Iterable, Sequence
-from contextlib import suppress
+import time
+from bisect import bisect_left
+from collections import UserDict, UserList, defaultdict
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager, suppress
 from datetime import datetime, timedelta, timezone
 from functools import lru_cache
-from itertools import groupby
-from math import copysign
+from operator import itemgetter
 from re import Match
-from typing import TYPE_CHECKING, Any, Callable, Protocol, SupportsFloat, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Final, Protocol, SupportsFloat, TypeVar
 
 import humanize
 import platformdirs
 from multimethod import multimethod
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
 from rich import box
 from rich.align import Align, VerticalAlignMethod
 from rich.bar import Bar
@@ -23,7 +27,7 @@ from rich.console import Console, RenderableType, RenderResult
 from rich.errors import MarkupError
 from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.syntax import Syntax, SyntaxTheme
 from rich.table import Column, Table
 from rich.text import Text
 from rich.theme import Theme
@@ -95,10 +99,12 @@ DISPLAY_HEADER: dict[RenderableType, str] = {
 
 
 class Pat:
-    SPLIT_PAT = re.compile(r"[;,] ?")
-    PRED_COLOR_PAT = re.compile(r"(pred color)\](.*?)(?=\[/)")
-    HTML_PARAGRAPH = re.compile(r"</?p>")
-    OPENING_BRACKET = re.compile(r"\[(?!/)")
+    SPLIT_PAT: Final = re.compile(r"[;,] ?")
+    PRED_COLOR_PAT: Final = re.compile(r"(pred color)\](.*?)(?=\[/)")
+    HTML_PARAGRAPH: Final = re.compile(r"</?p>")
+    OPENING_BRACKET: Final = re.compile(r"\[(?!/)")
+    FRACTIONAL_SECONDS: Final = re.compile(r"[.]\d+")
+    MD_TITLE: Final = re.compile(r"\[title\](.+?)\[/title\]\s+")
 
 
 _T_contra = TypeVar("_T_contra", contravariant=True)
@@ -115,11 +121,24 @@ K = TypeVar("K", bound=SupportsDunderLT[Any])
 def sortgroup_by(
     iterable: Iterable[T], key: Callable[[T], K]
 ) -> list[tuple[K, list[T]]]:
-    return [(k, list(g)) for k, g in groupby(sorted(iterable, key=key), key)]
+    """Group items by `key`, returning the groups sorted by their key.
+
+    Items are bucketed in a single pass, keeping their original order within each
+    group, so only the distinct keys need sorting.
+    """
+    groups: defaultdict[K, list[T]] = defaultdict(list)
+    for item in iterable:
+        groups[key(item)].append(item)
+
+    return sorted(groups.items(), key=itemgetter(0))
 
 
 def format_string(text: str) -> str:
-    if "[" in text and r"\[" not in text and ("[/" not in text or "pred color" in text):
+    # both substitutions below need an opening bracket to match anything
+    if "[" not in text:
+        return text
+
+    if r"\[" not in text and ("[/" not in text or "pred color" in text):
         text = Pat.OPENING_BRACKET.sub(r"\[", text)
 
     if "pred color]" in text:
@@ -139,20 +158,15 @@ def duration2human(duration: SupportsFloat) -> str:
     return "{:>12}".format(days + ":".join(map("{0:0>2}".format, time_parts)))
 
 
-def fmt_time(seconds: int) -> Iterable[str]:
-    abs_seconds = abs(seconds)
-    return (
-        f"{int(copysign(num, seconds)):>3}{unit}"
-        for num, unit in (
-            (abs_seconds // 86400, "d"),
-            (abs_seconds // 3600, "h"),
-            (abs_seconds % 3600 // 60, "m"),
-            (abs_seconds % 60, "s"),
-        )
-        if num
-    )
+def fmt_time(seconds: int) -> list[str]:
+    sign = -1 if seconds < 0 else 1
+    hours, rest = divmod(abs(seconds), 3600)
+    minutes, secs = divmod(rest, 60)
+    units = ((hours // 24, "d"), (hours, "h"), (minutes, "m"), (secs, "s"))
+    return [f"{sign * num:>3}{unit}" for num, unit in units if num]
 
 
+@lru_cache(maxsize=1)
 def get_theme() -> Theme | None:
     config_path = platformdirs.user_config_path("rich") / "config.ini"
     return Theme.read(str(config_path)) if config_path.exists() else None
@@ -210,7 +224,6 @@ class NewTable(Table):
         return super().__rich_console__(*args, **kwargs)
 
     def add_row(self, *args: RenderableType | None, **kwargs: Any) -> None:
-        rends = list(args)
         if (overflow := self.column_kwargs.get("overflow")) and (
             max_width := self.column_kwargs.get("max_width")
         ):
@@ -218,28 +231,55 @@ class NewTable(Table):
             for r in rends:
                 if isinstance(r, Text):
                     r.truncate(max_width, overflow=overflow)
+            args = tuple(rends)
 
-        return super().add_row(*rends, **kwargs)
+        return super().add_row(*args, **kwargs)
 
     def add_rows(self, rows: Iterable[Iterable[RenderableType]]) -> None:
         """Add multiple rows to the table."""
+        add_row = self.add_row
         for row in rows:
-            self.add_row(*row)
+            add_row(*row)
 
     def add_dict_row(
         self,
-        data: HashableDict,
+        data: Mapping[str, Any],
         ignore_extra_fields: bool = False,
         transform: Callable[..., RenderableType] = lambda v, _: str(v),
         **kwargs: Any,
     ) -> None:
         """Add a row to the table from a dictionary."""
+        self._add_dict_row(self.cols, data, ignore_extra_fields, transform, **kwargs)
+
+    def add_dict_rows(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        ignore_extra_fields: bool = False,
+        transform: Callable[..., RenderableType] = lambda v, _: str(v),
+        **kwargs: Any,
+    ) -> None:
+        """Add a row to the table from each dictionary."""
+        cols = self.cols
+        for item in items:
+            self._add_dict_row(cols, item, ignore_extra_fields, transform, **kwargs)
+
+    def _add_dict_row(
+        self,
+        cols: dict[str, Column],
+        data: Mapping[str, Any],
+        ignore_extra_fields: bool,
+        transform: Callable[..., RenderableType],
+        **kwargs: Any,
+    ) -> None:
+        """Add a row from a dictionary, registering any new columns in `cols`."""
         if not ignore_extra_fields:
-            for field in (f for f in data if f not in self.cols):
+            for field in (f for f in data if f not in cols):
                 self.add_column(field)
-                self.columns[-1]._cells = [""] * self.row_count
+                column = self.columns[-1]
+                column._cells = [""] * self.row_count
+                cols[str(column.header)] = column
 
-        values = (transform(data.get(k), k) for k in self.cols)
+        values = (transform(data.get(k), k) for k in cols)
 
         self.add_row(*values, **kwargs)
 
@@ -279,8 +319,14 @@ def list_table(items: Iterable[RenderableType], **kwargs: Any) -> NewTable:
     return new_table(rows=[[i] for i in items], **kwargs)
 
 
-def _randint() -> int:
-    return random.randint(50, 205)
+def _randint(rng: random.Random) -> int:
+    return rng.randint(50, 205)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _bar_base_color(width: float) -> tuple[int, int, int]:
+    rng = random.Random(str(width))
+    return _randint(rng), _randint(rng), _randint(rng)
 
 
 def adjust_color_intensity(
@@ -296,16 +342,17 @@ def adjust_color_intensity(
     return tuple(int(c * 255) for c in colorsys.hls_to_rgb(h, new_l, s))
 
 
-@lru_cache
+@lru_cache(maxsize=4096)
 def predictably_random_color(string: str, intensity: float | None = None) -> str:
-    random.seed(string.strip())
-    r, g, b = _randint(), _randint(), _randint()
+    rng = random.Random(string.strip())
+    r, g, b = _randint(rng), _randint(rng), _randint(rng)
     if intensity is not None:
         r, g, b = adjust_color_intensity((r, g, b), intensity)
 
     return f"#{r:02X}{g:02X}{b:02X}"
 
 
+@lru_cache(maxsize=8192)
 def _format_with_color(string: str, on: str | None = None) -> str:
     color = f"b {predictably_random_color(string)}"
     if on:
@@ -313,24 +360,34 @@ def _format_with_color(string: str, on: str | None = None) -> str:
     return wrap(string, color)
 
 
+@lru_cache(maxsize=8192)
 def split_with_color(text: str) -> str:
     return " ".join(
         _format_with_color(str(x)) for x in sorted(Pat.SPLIT_PAT.split(text))
     )
 
 
+@lru_cache(maxsize=8192)
+def _join_with_color(items: tuple[str, ...]) -> str:
+    return " ".join(map(_format_with_color, items))
+
+
 def format_with_color(items: str | Sequence[str]) -> str:
     if isinstance(items, str):
-        items = [items]
+        return _format_with_color(items)
+
+    return _join_with_color(tuple(map(str, items)))
 
-    return " ".join(_format_with_color(str(x)) for x in items)
+
+# pads labels displayed on black background
+BLACK_SEPARATOR = wrap("a", "#000000 on #000000")
 
 
 def format_with_color_on_black(items: str | Iterable[str]) -> str:
-    if not isinstance(items, Iterable) or isinstance(items, str):
+    if isinstance(items, str) or not isinstance(items, Iterable):
         items = sorted(Pat.SPLIT_PAT.split(str(items)))
 
-    sep = wrap("a", "#000000 on #000000")
+    sep = BLACK_SEPARATOR
     return " ".join(
         sep + _format_with_color(str(item), on="#000000") + sep for item in items
     )
@@ -365,9 +422,7 @@ def border_panel(content: RenderableType, **kwargs: Any) -> Panel:
 
 
 def md_panel(content: str, **kwargs: Any) -> Panel:
-    if "title" not in kwargs and (
-        m := re.match(r"\[title\](.+?)\[/title\]\s+", content)
-    ):
+    if "title" not in kwargs and (m := Pat.MD_TITLE.match(content)):
         kwargs["title"] = m[1]
         content = content.replace(m[0], "")
 
@@ -413,33 +468,55 @@ def progress_bar(
     if inverse:
         ratio = 1 - ratio
 
-    random.seed(str(width))
-
-    def norm() -> int:
-        return round(_randint() * ratio)
-
-    color = f"#{norm():0>2X}{norm():0>2X}{norm():0>2X}"
+    red, green, blue = (round(c * ratio) for c in _bar_base_color(width))
+    color = f"#{red:0>2X}{green:0>2X}{blue:0>2X}"
     return Bar(
         size=size, begin=0, width=int(width), end=end, color=color, bgcolor=bgcolor
     )
 
 
+_frozen_now: float | None = None
+
+
+@contextmanager
+def freeze_now() -> Iterator[None]:
+    """Make `get_now` return the same timestamp until the block exits.
+
+    Relative times rendered within a single table then agree with each other.
+    """
+    global _frozen_now
+    previous, _frozen_now = _frozen_now, time.time()
+    try:
+        yield
+    finally:
+        _frozen_now = previous
+
+
+def get_now() -> float:
+    """Return the frozen timestamp, if any, or the current time."""
+    return time.time() if _frozen_now is None else _frozen_now
+
+
+TIMESTAMP_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y%m%dT%H%M%SZ",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S%z",
+)
+
+
+@lru_cache(maxsize=8192)
 def timestamp2datetime(timestamp: str | float | None) -> datetime:
     if isinstance(timestamp, str):
-        timestamp = re.sub(r"[.]\d+", "", timestamp.strip("'"))
-        formats = [
-            "%Y-%m-%d",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y%m%dT%H%M%SZ",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S%z",
-        ]
-        for fmt in formats:
+        timestamp = Pat.FRACTIONAL_SECONDS.sub("", timestamp.strip("'"))
+        for fmt in TIMESTAMP_FORMATS:
             with suppress(ValueError):
                 return datetime.strptime(timestamp, fmt).replace(tzinfo=timezone.utc)
     return datetime.fromtimestamp(int(float(timestamp or 0)), tz=timezone.utc)
 
 
+@lru_cache(maxsize=8192)
 def timestamp2timestr(timestamp: str | float | None) -> str:
     return timestamp2datetime(timestamp).strftime("%T")
 
@@ -465,41 +542,77 @@ def get_colors_and_periods() -> list[tuple[Color, int, int]]:
     ]
 
 
+@lru_cache
+def get_period_limits() -> list[int]:
+    return [unit * max_factor for _, max_factor, unit in get_colors_and_periods()]
+
+
 @lru_cache
 def get_td_color(seconds: float) -> str:
-    for color, max_factor, seconds_in_unit in get_colors_and_periods():
-        if seconds <= seconds_in_unit * max_factor:
-            unit_count = seconds // seconds_in_unit
-            center = max_factor / 2
-            factor = -((unit_count - center) / center / 1.5) + 1
-            return (
-                color.filter("brightness", factor)
-                .clip()
-                .convert("srgb")
-                .to_string(hex=True)
-            )
+    periods = get_colors_and_periods()
+    idx = bisect_left(get_period_limits(), seconds)
+    if idx == len(periods):
+        raise AssertionError("Shouldn't get here")
 
-    raise AssertionError("Shouldn't get here")
+    color, max_factor, seconds_in_unit = periods[idx]
+    unit_count = seconds // seconds_in_unit
+    center = max_factor / 2
+    factor = -((unit_count - center) / center / 1.5) + 1
+    return color.filter("brightness", factor).clip().convert("srgb").to_string(hex=True)
 
 
 def human_dt(timestamp: str | float) -> str:
+    # `now` is part of the cache key, so repeated timestamps can only hit the cache
+    # while it is frozen by `freeze_now`: skip the cache otherwise
+    if _frozen_now is None:
+        return _human_dt(timestamp, time.time())
+
+    return _cached_human_dt(timestamp, _frozen_now)
+
+
+def _human_dt(timestamp: str | float, now: float) -> str:
     try:
         dt = timestamp2datetime(timestamp)
     except ValueError:
         return str(timestamp)
 
-    human_dt = humanize.naturaltime(dt)
+    human_dt = humanize.naturaltime(dt, when=datetime.fromtimestamp(now, timezone.utc))
 
-    color = get_td_color(abs((dt.now(tz=dt.tzinfo) - dt).total_seconds()))
+    color = get_td_color(abs(now - dt.timestamp()))
 
     return f"[b {color}]{human_dt}[/]"
 
 
-def syntax(*args: Any, **kwargs: Any) -> Syntax:
-    kwargs.setdefault("theme", "nord")
+_cached_human_dt = lru_cache(maxsize=4096)(_human_dt)
+
+
+@lru_cache
+def get_lexer(name: str) -> Lexer | str:
+    """Return a shared lexer for the language `name`.
+
+    `Syntax` looks the lexer up by name every time it highlights the code, while
+    lexers are stateless and can be reused. Unknown names are returned as they are
+    for `Syntax` to fall back to plain text.
+    """
+    try:
+        return get_lexer_by_name(name, stripnl=False, ensurenl=True, tabsize=4)
+    except ClassNotFound:
+        return name
+
+
+@lru_cache
+def get_syntax_theme(name: str) -> SyntaxTheme:
+    """Return a shared syntax theme, which keeps its token style cache warm."""
+    return Syntax.get_theme(name)
+
+
+def syntax(code: str, lexer: Lexer | str, **kwargs: Any) -> Syntax:
+    kwargs["theme"] = get_syntax_theme(kwargs.get("theme", "nord"))
     kwargs.setdefault("background_color", "default")
     kwargs.setdefault("word_wrap", True)
-    return Syntax(*args, **kwargs)
+    if isinstance(lexer, str):
+        lexer = get_lexer(lexer)
+    return Syntax(code, lexer, **kwargs)
 
 
 def sql_syntax(sql_string: str) -> Syntax:
@@ -519,19 +632,11 @@ def sql_syntax(sql_string: str) -> Syntax:
     )
 
 
-def colored_with_bg(items: str | Iterable[str]) -> str:
-    if isinstance(items, str):
-        items = sorted(Pat.SPLIT_PAT.split(items))
-
-    sep = wrap("a", "#000000 on #000000")
-    return " ".join(
-        sep + wrap(item, f"bold {predictably_random_color(item)} on #000000") + sep
-        for item in items
-    )
+colored_with_bg = format_with_color_on_black
 
 
 def colored_split(items: str | Iterable[str]) -> str:
     if isinstance(items, str):
-        items = sorted(Pat.SPLIT_PAT.split(items))
+        return split_with_color(items)
 
     return " ".join(map(format_with_color, items))
@@ -1,3 +1,4 @@
+import json
 import re
 import sys
 from collections.abc import Iterator
@@ -6,7 +7,7 @@ from pathlib import Path
 import pytest
 from freezegun import freeze_time
 
-from rich_tables import table
+from rich_tables import diff, table
 from rich_tables.utils import make_console
 
 JSON_DIR = Path("tests/json")
@@ -37,10 +38,23 @@ def _populate_readme() -> Iterator[None]:
 
 @freeze_time("2022-04-01")
 @pytest.mark.parametrize("testcase", TEST_FILES, ids=str)
-def test_outputs(testcase: Path) -> None:
+def test_outputs(testcase: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # rapidfuzz aligns the words of long texts differently
+    monkeypatch.setattr(diff, "HAS_RAPIDFUZZ", False)
     sys.stdin = testcase.open()
     sys.argv[1:] = []
 
     table.console = make_console(record=True, width=156)
     table.main()
     table.console.save_svg(str(SVG_DIR / f"{testcase.stem}.svg"))
+
+
+def test_rapidfuzz_opcodes() -> None:
+    pytest.importorskip("rapidfuzz")
+    data = json.loads((JSON_DIR / "long_text_diff.json").read_text())
+    before, after = data["before"], data["after"]
+
+    ops = diff.get_opcodes(before, after)
+
+    assert "".join(before[a1:a2] for _, a1, a2, _, _ in ops) == before
+    assert "".join(after[b1:b2] for _, _, _, b1, b2 in ops) == after